@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Author, Book
 
 
@@ -26,10 +27,15 @@ class AuthorAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate the book count so the changelist doesn't query per row"""
+        return super().get_queryset(request).annotate(_books_count=Count('books'))
+    
     def books_count(self, obj):
         """Display the number of books by this author"""
-        return obj.books.count()
+        return obj._books_count
     books_count.short_description = 'Books Count'
+    books_count.admin_order_field = '_books_count'
 
 
 @admin.register(Book)
@@ -41,7 +47,12 @@ class BookAdmin(admin.ModelAdmin):
     including search functionality, filtering, and display customization.
     """
     list_display = ['title', 'author', 'publication_year', 'created_at']
-    list_filter = ['publication_year', 'author', 'created_at', 'updated_at']
+    list_filter = [
+        'publication_year',
+        ('author', admin.RelatedOnlyFieldListFilter),
+        'created_at',
+        'updated_at',
+    ]
     search_fields = ['title', 'author__name']
     ordering = ['-publication_year', 'title']
     readonly_fields = ['created_at', 'updated_at']
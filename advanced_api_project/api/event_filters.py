@@ -0,0 +1,42 @@
+from django_filters import rest_framework as filters
+from django.utils import timezone
+from .models import Event
+
+
+class EventFilter(filters.FilterSet):
+    """
+    Filter set for Event model
+    
+    Provides the date and capacity range lookups for the event list,
+    plus a flag for upcoming events only.
+    """
+    
+    # The rest_framework BooleanFilter's widget reads true/false/1/0 in any
+    # case, like the view's old upcoming.lower() == 'true' check did
+    upcoming = filters.BooleanFilter(
+        method='filter_upcoming',
+        help_text="Filter for events that haven't started yet (true); false leaves the list unfiltered"
+    )
+    
+    class Meta:
+        model = Event
+        fields = {
+            'date_time': ['gte', 'lte', 'exact', 'gt', 'lt'],
+            'capacity': ['gte', 'lte', 'exact', 'gt', 'lt'],
+        }
+    
+    def filter_upcoming(self, queryset, name, value):
+        """
+        Custom filter method to keep only upcoming events
+        
+        Args:
+            queryset: The current queryset
+            name: The filter field name
+            value: Boolean value (True for upcoming events only)
+            
+        Returns:
+            Filtered queryset
+        """
+        if value:
+            return queryset.filter(date_time__gte=timezone.now())
+        return queryset
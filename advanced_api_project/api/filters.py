@@ -1,8 +1,33 @@
+from functools import lru_cache
+
 import django_filters
 from django_filters import rest_framework as filters
+from django.db.models import Count, Exists, OuterRef
+from django.db.models.functions import Length
+from django.utils import timezone
 from .models import Book, Author
 
 
+@lru_cache(maxsize=1)
+def _recent_threshold(today):
+    """Return the earliest publication year still counted as recent"""
+    return today.year - 10
+
+
+def _author_queryset(request):
+    """
+    Limit the author filter choices to the author being requested
+    
+    Rendering the filter form (browsable API) would otherwise load every
+    author just to build the <option> list.
+    """
+    authors = Author.objects.only('id', 'name')
+    if request is None:
+        return authors
+    author_id = request.GET.get('author', '')
+    return authors.filter(pk=author_id) if author_id.isdigit() else authors.none()
+
+
 class BookFilter(filters.FilterSet):
     """
     Advanced filter set for Book model
@@ -14,9 +39,12 @@ class BookFilter(filters.FilterSet):
     Features:
         - Title filtering (contains, exact, starts_with)
         - Author filtering (by name, by ID)
-        - Publication year filtering (exact, range, greater/less than)
+        - Publication year filtering (exact, greater/less than)
         - Date range filtering for creation and updates
         - Custom filters for complex queries
+    
+    Prefix, suffix and year range lookups come from Meta.fields, e.g.
+    ?title__istartswith=Py or ?publication_year__gte=1900&publication_year__lte=2000
     """
     
     # Title filtering with multiple options
@@ -29,15 +57,11 @@ class BookFilter(filters.FilterSet):
         lookup_expr='exact',
         help_text="Filter books by exact title match"
     )
-    title_starts_with = django_filters.CharFilter(
-        field_name='title',
-        lookup_expr='istartswith',
-        help_text="Filter books by title starting with specific text"
-    )
     
     # Author filtering
     author = django_filters.ModelChoiceFilter(
-        queryset=Author.objects.all(),
+        queryset=_author_queryset,
+        to_field_name='id',
         help_text="Filter books by author ID"
     )
     author_name = django_filters.CharFilter(
@@ -51,25 +75,6 @@ class BookFilter(filters.FilterSet):
         help_text="Filter books by exact author name match"
     )
     
-    # Publication year filtering with multiple options
-    publication_year = django_filters.NumberFilter(
-        help_text="Filter books by exact publication year"
-    )
-    publication_year_min = django_filters.NumberFilter(
-        field_name='publication_year',
-        lookup_expr='gte',
-        help_text="Filter books published in or after this year"
-    )
-    publication_year_max = django_filters.NumberFilter(
-        field_name='publication_year',
-        lookup_expr='lte',
-        help_text="Filter books published in or before this year"
-    )
-    publication_year_range = django_filters.RangeFilter(
-        field_name='publication_year',
-        help_text="Filter books published within a year range (e.g., ?publication_year_range_min=1900&publication_year_range_max=2000)"
-    )
-    
     # Date filtering for creation and updates
     created_after = django_filters.DateTimeFilter(
         field_name='created_at',
@@ -128,10 +133,8 @@ class BookFilter(filters.FilterSet):
         Returns:
             Filtered queryset
         """
-        if value:
-            return queryset.filter(author__isnull=False)
-        else:
-            return queryset.filter(author__isnull=True)
+        # Check the raw FK column so no join to the author table is needed
+        return queryset.filter(author_id__isnull=not value)
     
     def filter_recent_books(self, queryset, name, value):
         """
@@ -145,9 +148,7 @@ class BookFilter(filters.FilterSet):
         Returns:
             Filtered queryset
         """
-        from datetime import datetime
-        current_year = datetime.now().year
-        threshold_year = current_year - 10
+        threshold_year = _recent_threshold(timezone.localdate())
         
         if value:
             return queryset.filter(publication_year__gte=threshold_year)
@@ -167,7 +168,7 @@ class BookFilter(filters.FilterSet):
             Filtered queryset
         """
         if value and value > 0:
-            return queryset.extra(where=['LENGTH(title) >= %s'], params=[value])
+            return queryset.annotate(_title_length=Length('title')).filter(_title_length__gte=value)
         return queryset
 
 
@@ -236,10 +237,8 @@ class AuthorFilter(filters.FilterSet):
         Returns:
             Filtered queryset
         """
-        if value:
-            return queryset.filter(books__isnull=False).distinct()
-        else:
-            return queryset.filter(books__isnull=True)
+        has_books = Exists(Book.objects.filter(author=OuterRef('pk')))
+        return queryset.annotate(_has_books=has_books).filter(_has_books=value)
     
     def filter_min_books(self, queryset, name, value):
         """
@@ -254,8 +253,13 @@ class AuthorFilter(filters.FilterSet):
             Filtered queryset
         """
         if value and value > 0:
-            from django.db.models import Count
-            return queryset.annotate(
-                book_count=Count('books')
-            ).filter(book_count__gte=value)
+            # Group only the book table by author_id, then semi-join authors
+            authors_with_enough_books = (
+                Book.objects.values('author_id')
+                .annotate(book_count=Count('*'))
+                .filter(book_count__gte=value)
+                .values('author_id')
+            )
+            return queryset.filter(pk__in=authors_with_enough_books)
         return queryset
+
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(django.db.models.functions.text.Length('title'), name='book_title_len_idx'),
+        ),
+    ]
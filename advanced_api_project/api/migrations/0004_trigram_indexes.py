@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# Trigram indexes let PostgreSQL serve the icontains/istartswith filters
+# on book titles and author names from an index instead of a full scan.
+# pg_trgm is PostgreSQL-only, so other backends (SQLite in development)
+# skip these operations.
+TRIGRAM_INDEXES = [
+    ('book_title_trgm', 'api_book', 'title'),
+    ('author_name_trgm', 'api_author', 'name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_book_book_year_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:44
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('api', '0005_book_book_author_year_idx'),
+    ]
+
+    # Added by hand: admin's first migration points LogEntry at
+    # AUTH_USER_MODEL, so the custom user has to exist before it runs
+    run_before = [
+        ('admin', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(max_length=150, unique=True)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('first_name', models.CharField(blank=True, max_length=30)),
+                ('last_name', models.CharField(blank=True, max_length=150)),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_staff', models.BooleanField(default=False)),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'user',
+                'verbose_name_plural': 'users',
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Event',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='Enter the event title', max_length=200)),
+                ('description', models.TextField(help_text='Enter a detailed description of the event')),
+                ('date_time', models.DateTimeField(help_text='Enter the date and time of the event')),
+                ('location', models.CharField(help_text='Enter the event location', max_length=200)),
+                ('capacity', models.PositiveIntegerField(help_text='Enter the maximum number of attendees', validators=[django.core.validators.MinValueValidator(1)])),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('attendees', models.ManyToManyField(blank=True, help_text='Users who are attending this event', related_name='attending_events', to=settings.AUTH_USER_MODEL)),
+                ('organizer', models.ForeignKey(help_text='Select the event organizer', on_delete=django.db.models.deletion.CASCADE, related_name='organized_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['date_time'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date_time'], name='event_date_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['organizer', 'date_time'], name='event_organizer_date_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_user_event'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.CheckConstraint(check=models.Q(('capacity__gte', 1)), name='event_capacity_gte_1'),
+        ),
+    ]
@@ -82,27 +82,58 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['date_time']
+        indexes = [
+            # Serves the default date ordering and cursor pagination
+            models.Index(fields=['date_time'], name='event_date_time_idx'),
+            # Serves UserEventsView's organized events, already in date order
+            models.Index(fields=['organizer', 'date_time'], name='event_organizer_date_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(capacity__gte=1),
+                name='event_capacity_gte_1'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.date_time.strftime('%Y-%m-%d %H:%M')}"
 
+    @property
+    def attendee_count(self):
+        """Number of attendees, read from the annotation or prefetched attendees when present."""
+        if hasattr(self, '_attendee_count'):
+            return self._attendee_count
+        if 'attendees' in getattr(self, '_prefetched_objects_cache', {}):
+            return len(self.attendees.all())
+        return self.attendees.count()
+
     def is_full(self):
         """Check if the event has reached its capacity."""
-        return self.attendees.count() >= self.capacity
+        return self.attendee_count >= self.capacity
 
     def can_register(self, user):
         """Check if a user can register for this event."""
-        return not self.is_full() and user != self.organizer and not self.attendees.filter(id=user.id).exists()
+        if user.id == self.organizer_id or self.is_full():
+            return False
+        # Reuses prefetched attendees, so list views don't query once per event
+        if not hasattr(self, '_attendee_ids'):
+            self._attendee_ids = {attendee.id for attendee in self.attendees.all()}
+        return user.id not in self._attendee_ids
 
     def clean(self):
         """Validate the event data."""
         from django.core.exceptions import ValidationError
         if self.date_time < timezone.now():
             raise ValidationError('Event date cannot be in the past')
-        if self.capacity < 1:
-            raise ValidationError('Capacity must be at least 1')
 
-    def save(self, *args, **kwargs):
-        """Override save to run full_clean and update timestamps."""
-        self.full_clean()
+    def save(self, *args, skip_validation=False, **kwargs):
+        """
+        Override save to run full_clean and update timestamps.
+
+        Pass skip_validation=True when the data has already been validated
+        (e.g. by EventSerializer) or for bulk loads, to avoid re-running
+        every field validator on each write.
+        """
+        if not skip_validation:
+            self.full_clean()
         super().save(*args, **kwargs)
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination for event listings
+
+    Each page continues from the last date_time seen instead of counting
+    past an OFFSET, so deep pages cost the same as the first one. The
+    ordering follows the view's OrderingFilter when ?ordering= is given.
+    """
+    ordering = 'date_time'
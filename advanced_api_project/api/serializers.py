@@ -10,10 +10,7 @@ User = get_user_model()
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Custom token obtain serializer to include user data in the response."""
     def validate(self, attrs):
-        data = super().validate(attrs)
-        refresh = self.get_token(self.user)
-        data['refresh'] = str(refresh)
-        data['access'] = str(refresh.access_token)
+        data = super().validate(attrs)  # already sets 'refresh' and 'access'
         data['user'] = UserSerializer(self.user).data
         return data
 
@@ -21,15 +18,12 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the User model."""
     password = serializers.CharField(write_only=True, required=False)
-    events_organized = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
-    attending_events = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
 
     class Meta:
         model = User
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name',
-            'password', 'is_active', 'date_joined', 'events_organized',
-            'attending_events'
+            'password', 'is_active', 'date_joined'
         ]
         read_only_fields = ['is_active', 'date_joined']
         extra_kwargs = {
@@ -54,11 +48,36 @@ class UserSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class UserDetailSerializer(UserSerializer):
+    """
+    User serializer that also lists the user's events.
+
+    The event id lists cost two extra queries per user, so they are only
+    included where a single user is rendered (the profile endpoint).
+    """
+    events_organized = serializers.PrimaryKeyRelatedField(
+        source='organized_events', many=True, read_only=True
+    )
+    attending_events = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['events_organized', 'attending_events']
+
+
+class AttendeeSerializer(serializers.ModelSerializer):
+    """Lightweight user representation for nesting inside events."""
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'email']
+        read_only_fields = fields
+
+
 class EventSerializer(serializers.ModelSerializer):
     """Serializer for the Event model."""
-    organizer = UserSerializer(read_only=True)
-    attendees = UserSerializer(many=True, read_only=True)
-    is_full = serializers.BooleanField(read_only=True)
+    organizer = AttendeeSerializer(read_only=True)
+    attendees = AttendeeSerializer(many=True, read_only=True)
+    is_full = serializers.SerializerMethodField()
     can_register = serializers.SerializerMethodField()
     attendee_count = serializers.SerializerMethodField()
 
@@ -73,7 +92,11 @@ class EventSerializer(serializers.ModelSerializer):
 
     def get_attendee_count(self, obj):
         """Get the number of attendees for the event."""
-        return obj.attendees.count()
+        return obj.attendee_count
+
+    def get_is_full(self, obj):
+        """Check whether the event has reached its capacity."""
+        return obj.is_full()
 
     def get_can_register(self, obj):
         """Check if the current user can register for this event."""
@@ -93,9 +116,27 @@ class EventSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             validated_data['organizer'] = request.user
-            return super().create(validated_data)
+            # The fields are validated above, so the model's full_clean is skipped
+            event = Event(**validated_data)
+            event.save(skip_validation=True)
+            return event
         raise serializers.ValidationError("You must be logged in to create an event.")
 
+    def update(self, instance, validated_data):
+        """Update the event without re-running the model's full_clean."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(skip_validation=True)
+        return instance
+
+
+class UserEventSerializer(EventSerializer):
+    """Event serializer for a user's own events, with their part in each."""
+    role = serializers.CharField(read_only=True)
+
+    class Meta(EventSerializer.Meta):
+        fields = EventSerializer.Meta.fields + ['role']
+
 
 class EventRegistrationSerializer(serializers.Serializer):
     """Serializer for event registration."""
@@ -103,8 +144,6 @@ class EventRegistrationSerializer(serializers.Serializer):
 
     def validate_user_id(self, value):
         """Validate that the user exists."""
-        try:
-            User.objects.get(pk=value)
-        except User.DoesNotExist:
+        if not User.objects.filter(pk=value).exists():
             raise serializers.ValidationError("User does not exist.")
         return value
@@ -0,0 +1,230 @@
+"""
+Unit tests for the event endpoints
+
+Covers the upcoming filter on the event list, event writes, the
+short-lived cache behind upcoming-event listings and the API root links.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import get_script_prefix, reverse, set_script_prefix
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Event, User
+
+
+class EventTestCase(APITestCase):
+    """Base test case with a user, one past event and one upcoming event"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the users and events once per test class"""
+        cls.user = User.objects.create_user(
+            email='organizer@example.com', username='organizer', password=None
+        )
+        cls.other_user = User.objects.create_user(
+            email='attendee@example.com', username='attendee', password=None
+        )
+        # Created through the queryset so the model's past-date validation
+        # doesn't reject the past event
+        now = timezone.now()
+        cls.past_event = Event.objects.bulk_create([Event(
+            title='Past Event', description='Already happened',
+            date_time=now - timedelta(days=1), location='Kigali',
+            capacity=10, organizer=cls.user,
+        )])[0]
+        cls.upcoming_event = Event.objects.create(
+            title='Upcoming Event', description='Coming soon',
+            date_time=now + timedelta(days=1), location='Kigali',
+            capacity=10, organizer=cls.user,
+        )
+        cls.URL_EVENT_LIST = reverse('api:event-list')
+
+    def setUp(self):
+        """Authenticate every request as the organizer"""
+        self.client.force_authenticate(user=self.user)
+
+    def list_titles(self, **params):
+        """Return the titles on the event list page for the given query params"""
+        response = self.client.get(self.URL_EVENT_LIST, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [event['title'] for event in response.data['results']]
+
+
+class EventFilterTests(EventTestCase):
+    """Test cases for the event list filters"""
+
+    def test_upcoming_values_are_case_insensitive(self):
+        """Test that every spelling of true keeps only upcoming events"""
+        for value in ('true', 'True', 'TRUE', '1'):
+            with self.subTest(upcoming=value):
+                self.assertEqual(self.list_titles(upcoming=value), ['Upcoming Event'])
+
+    def test_upcoming_false_leaves_list_unfiltered(self):
+        """Test that false, 0 and unknown values return every event"""
+        for value in ('false', '0', '2'):
+            with self.subTest(upcoming=value):
+                self.assertEqual(
+                    self.list_titles(upcoming=value), ['Past Event', 'Upcoming Event']
+                )
+
+
+class EventWriteTests(EventTestCase):
+    """Test cases for creating and updating events through the API"""
+
+    def test_create_skips_model_full_clean(self):
+        """Test that EventSerializer saves without re-running full_clean"""
+        with mock.patch.object(Event, 'full_clean') as full_clean:
+            response = self.client.post(self.URL_EVENT_LIST, {
+                'title': 'Created Event', 'description': 'New',
+                'date_time': (timezone.now() + timedelta(days=3)).isoformat(),
+                'location': 'Kigali', 'capacity': 5,
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        full_clean.assert_not_called()
+        self.assertEqual(Event.objects.get(title='Created Event').organizer, self.user)
+
+    def test_update_skips_model_full_clean(self):
+        """Test that a partial update saves without re-running full_clean"""
+        url = reverse('api:event-detail', kwargs={'pk': self.upcoming_event.pk})
+        with mock.patch.object(Event, 'full_clean') as full_clean:
+            response = self.client.patch(url, {'title': 'Renamed Event'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        full_clean.assert_not_called()
+        self.upcoming_event.refresh_from_db()
+        self.assertEqual(self.upcoming_event.title, 'Renamed Event')
+
+    def test_create_still_validates_past_dates(self):
+        """Test that the serializer still rejects events in the past"""
+        response = self.client.post(self.URL_EVENT_LIST, {
+            'title': 'Past', 'description': 'Too late',
+            'date_time': (timezone.now() - timedelta(days=1)).isoformat(),
+            'location': 'Kigali', 'capacity': 5,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('date_time', response.data)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class EventListCacheTests(EventTestCase):
+    """Test cases for the cached upcoming-event listings"""
+
+    def setUp(self):
+        """Start every test with an empty cache"""
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def create_unseen_event(self, title='Unseen Event'):
+        """Create an upcoming event without going through the API's invalidation"""
+        return Event.objects.create(
+            title=title, description='Created behind the cache',
+            date_time=timezone.now() + timedelta(days=2), location='Kigali',
+            capacity=10, organizer=self.user,
+        )
+
+    def test_upcoming_list_is_served_from_cache(self):
+        """Test that a repeated upcoming request skips the database"""
+        self.list_titles(upcoming='true')
+        self.create_unseen_event()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.URL_EVENT_LIST, {'upcoming': 'true'})
+        titles = [event['title'] for event in response.data['results']]
+        self.assertEqual(titles, ['Upcoming Event'])
+
+    def test_uncached_requests_see_new_events(self):
+        """Test that listings without upcoming are never cached"""
+        self.list_titles()
+        self.list_titles(upcoming='false')
+        self.create_unseen_event()
+
+        self.assertIn('Unseen Event', self.list_titles())
+        self.assertIn('Unseen Event', self.list_titles(upcoming='false'))
+
+    def test_cache_is_per_user(self):
+        """Test that one user's cached page isn't served to another"""
+        self.list_titles(upcoming='true')
+        self.create_unseen_event()
+
+        self.client.force_authenticate(user=self.other_user)
+        self.assertIn('Unseen Event', self.list_titles(upcoming='true'))
+
+    def test_create_invalidates_cache(self):
+        """Test that creating an event through the API drops cached lists"""
+        self.list_titles(upcoming='true')
+
+        response = self.client.post(self.URL_EVENT_LIST, {
+            'title': 'Created Event', 'description': 'New',
+            'date_time': (timezone.now() + timedelta(days=3)).isoformat(),
+            'location': 'Kigali', 'capacity': 5,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertIn('Created Event', self.list_titles(upcoming='true'))
+
+    def test_update_invalidates_cache(self):
+        """Test that updating an event drops cached lists"""
+        self.list_titles(upcoming='true')
+
+        url = reverse('api:event-detail', kwargs={'pk': self.upcoming_event.pk})
+        response = self.client.patch(url, {'title': 'Renamed Event'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.list_titles(upcoming='true'), ['Renamed Event'])
+
+    def test_delete_invalidates_cache(self):
+        """Test that deleting an event drops cached lists"""
+        self.list_titles(upcoming='true')
+
+        url = reverse('api:event-detail', kwargs={'pk': self.upcoming_event.pk})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertEqual(self.list_titles(upcoming='true'), [])
+
+    def test_registration_invalidates_cache(self):
+        """Test that registering and unregistering drop cached lists"""
+        url = reverse('api:event-register', kwargs={'event_id': self.upcoming_event.pk})
+
+        def attendee_count():
+            response = self.client.get(self.URL_EVENT_LIST, {'upcoming': 'true'})
+            return response.data['results'][0]['attendee_count']
+
+        self.assertEqual(attendee_count(), 0)
+
+        self.client.force_authenticate(user=self.other_user)
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(attendee_count(), 1)
+
+        self.client.force_authenticate(user=self.other_user)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(attendee_count(), 0)
+
+
+class APIRootTests(APITestCase):
+    """Test cases for the API root view"""
+
+    def test_links_follow_script_prefix(self):
+        """Test that the links use each request's script prefix"""
+        # The test client doesn't set the prefix from SCRIPT_NAME the way
+        # the WSGI handler does, so set it directly
+        url = reverse('api:api-root')
+        self.addCleanup(set_script_prefix, get_script_prefix())
+
+        set_script_prefix('/')
+        first = self.client.get(url).data['events']['list']
+        set_script_prefix('/mounted/')
+        mounted = self.client.get(url).data['events']['list']
+
+        self.assertEqual(first, 'http://testserver/api/events/')
+        self.assertEqual(mounted, 'http://testserver/mounted/api/events/')
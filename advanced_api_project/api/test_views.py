@@ -14,66 +14,89 @@ from django.urls import reverse
 from django.contrib.auth.models import User
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from django.utils import timezone
-from datetime import datetime, timedelta
 
 from .models import Author, Book
 from .serializers import BookSerializer, AuthorSerializer
 
 
+# Request body with a trailing comma, for the malformed JSON test
+_BAD_JSON = b'{"title": "Malformed Book", "publication_year": 2023,}'
+
+
 class BaseTestCase(APITestCase):
     """Base test case with common setup and helper methods"""
     
-    def setUp(self):
-        """Set up test data and user"""
-        # Create test user
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data and user once per test class"""
+        # Create test user (tests use force_authenticate, so skip password hashing)
+        cls.user = User(username='testuser', email='test@example.com')
+        cls.user.set_unusable_password()
+        cls.user.save()
         
         # Create test author
-        self.author = Author.objects.create(
+        cls.author = Author.objects.create(
             name='Test Author'
         )
         
         # Create test book
-        self.book = Book.objects.create(
+        cls.book = Book.objects.create(
             title='Test Book',
             publication_year=2023,
-            author=self.author
+            author=cls.author
         )
         
         # Create additional test data
-        self.author2 = Author.objects.create(
+        cls.author2 = Author.objects.create(
             name='Another Author'
         )
         
-        self.book2 = Book.objects.create(
+        cls.book2 = Book.objects.create(
             title='Another Book',
             publication_year=2022,
-            author=self.author2
+            author=cls.author2
         )
         
-        self.book3 = Book.objects.create(
+        cls.book3 = Book.objects.create(
             title='Python Programming',
             publication_year=2021,
-            author=self.author
+            author=cls.author
         )
         
-        # Set up API client
+        # Resolve the named routes once instead of in every test
+        cls.URL_BOOK_LIST = reverse('api:book-list')
+        cls.URL_BOOK_CREATE = reverse('api:book-create')
+        cls.URL_BOOK_DETAIL = reverse('api:book-detail', kwargs={'pk': cls.book.id})
+        cls.URL_BOOK_UPDATE = reverse('api:book-update', kwargs={'pk': cls.book.id})
+        cls.URL_BOOK_DELETE = reverse('api:book-delete', kwargs={'pk': cls.book.id})
+        cls.URL_BOOK_CRUD = reverse('api:book-crud', kwargs={'pk': cls.book.id})
+        cls.URL_AUTHOR_LIST = reverse('api:author-list')
+        cls.URL_AUTHOR_LIST_CREATE = reverse('api:author-list-create')
+        cls.URL_AUTHOR_DETAIL = reverse('api:author-detail', kwargs={'pk': cls.author.id})
+        cls.URL_AUTHOR_BOOKS = reverse('api:author-books', kwargs={'author_id': cls.author.id})
+        cls.URL_TEST_SERIALIZERS = reverse('api:test-serializers')
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Shared by read-only and authenticated tests. Assigned here rather
+        # than in setUpTestData so Django doesn't deep-copy them for every test.
+        cls._ro_client = APIClient()
+        cls._auth_client = APIClient()
+        cls._auth_client.force_authenticate(user=cls.user)
+    
+    def setUp(self):
+        """Set up a fresh API client for each test"""
         self.client = APIClient()
     
-    def tearDown(self):
-        """Clean up after tests"""
-        User.objects.all().delete()
-        Author.objects.all().delete()
-        Book.objects.all().delete()
+    @property
+    def ro_client(self):
+        """Client for tests that never authenticate or otherwise change client state"""
+        return self.__class__._ro_client
     
-    def authenticate_user(self):
-        """Authenticate the test user"""
-        self.client.force_authenticate(user=self.user)
+    def auth_client(self):
+        """Client already authenticated as the test user"""
+        return self.__class__._auth_client
     
     def create_test_book_data(self, **kwargs):
         """Create test book data with defaults"""
@@ -91,8 +114,8 @@ class BookListViewTests(BaseTestCase):
     
     def test_get_books_list_public_access(self):
         """Test that books list is publicly accessible"""
-        url = reverse('api:book-list')
-        response = self.client.get(url)
+        url = self.URL_BOOK_LIST
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('results', response.data)
@@ -103,62 +126,63 @@ class BookListViewTests(BaseTestCase):
     
     def test_get_books_list_with_filtering(self):
         """Test books list with various filters"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
-        # Test title filter
-        response = self.client.get(url, {'title': 'Test'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['title'], 'Test Book')
-        
-        # Test publication year filter
-        response = self.client.get(url, {'publication_year': '2023'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['publication_year'], 2023)
+        # (params, expected result count, expected (field, value) of first result)
+        cases = [
+            ({'title': 'Test'}, 1, ('title', 'Test Book')),
+            ({'publication_year': '2023'}, 1, ('publication_year', 2023)),
+            ({'author': self.author.id}, 2, None),
+        ]
         
-        # Test author filter
-        response = self.client.get(url, {'author': self.author.id})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 2)
+        for params, expected_len, expected_first in cases:
+            with self.subTest(params=params):
+                response = self.ro_client.get(url, params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['results']), expected_len)
+                if expected_first:
+                    field, value = expected_first
+                    self.assertEqual(response.data['results'][0][field], value)
     
     def test_get_books_list_with_search(self):
         """Test books list with search functionality"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
-        # Search for "Python"
-        response = self.client.get(url, {'search': 'Python'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['title'], 'Python Programming')
+        # (search term, expected result count, expected first title)
+        cases = [
+            ('Python', 1, 'Python Programming'),
+            # "Test" appears in both "Test Book" title and "Test Author" name, so we get 2 results
+            ('Test', 2, None),
+        ]
         
-        # Search for "Test"
-        response = self.client.get(url, {'search': 'Test'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # "Test" appears in both "Test Book" title and "Test Author" name, so we get 2 results
-        self.assertEqual(len(response.data['results']), 2)
+        for term, expected_len, expected_first in cases:
+            with self.subTest(search=term):
+                response = self.ro_client.get(url, {'search': term})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['results']), expected_len)
+                if expected_first:
+                    self.assertEqual(response.data['results'][0]['title'], expected_first)
     
     def test_get_books_list_with_ordering(self):
         """Test books list with ordering"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
-        # Order by title ascending
-        response = self.client.get(url, {'ordering': 'title'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        results = response.data['results']
-        self.assertEqual(results[0]['title'], 'Another Book')
-        self.assertEqual(results[1]['title'], 'Python Programming')
-        self.assertEqual(results[2]['title'], 'Test Book')
+        # (ordering, expected titles in order)
+        cases = [
+            ('title', ('Another Book', 'Python Programming', 'Test Book')),
+            ('-title', ('Test Book', 'Python Programming', 'Another Book')),
+        ]
         
-        # Order by title descending
-        response = self.client.get(url, {'ordering': '-title'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        results = response.data['results']
-        self.assertEqual(results[0]['title'], 'Test Book')
+        for ordering, expected_titles in cases:
+            with self.subTest(ordering=ordering):
+                response = self.ro_client.get(url, {'ordering': ordering})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                titles = tuple(r['title'] for r in response.data['results'])
+                self.assertEqual(titles, expected_titles)
     
     def test_get_books_list_with_combined_filters(self):
         """Test books list with multiple filters combined"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
         # Combine search, filter, and ordering
         params = {
@@ -166,7 +190,7 @@ class BookListViewTests(BaseTestCase):
             'publication_year': '2023',
             'ordering': 'title'
         }
-        response = self.client.get(url, params)
+        response = self.ro_client.get(url, params)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
@@ -175,15 +199,17 @@ class BookListViewTests(BaseTestCase):
     def test_get_books_list_pagination(self):
         """Test that pagination works correctly"""
         # Create more books to test pagination (use past years to avoid validation issues)
-        for i in range(15):
-            Book.objects.create(
+        Book.objects.bulk_create([
+            Book(
                 title=f'Book {i}',
                 publication_year=2010 + i,
                 author=self.author
             )
+            for i in range(15)
+        ])
         
-        url = reverse('api:book-list')
-        response = self.client.get(url)
+        url = self.URL_BOOK_LIST
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('count', response.data)
@@ -197,11 +223,10 @@ class BookCreateViewTests(BaseTestCase):
     
     def test_create_book_authenticated_user(self):
         """Test creating a book with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:book-create')
+        url = self.URL_BOOK_CREATE
         
         book_data = self.create_test_book_data()
-        response = self.client.post(url, book_data, format='json')
+        response = self.auth_client().post(url, book_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('message', response.data)
@@ -213,7 +238,7 @@ class BookCreateViewTests(BaseTestCase):
     
     def test_create_book_unauthenticated_user(self):
         """Test that unauthenticated users cannot create books"""
-        url = reverse('api:book-create')
+        url = self.URL_BOOK_CREATE
         book_data = self.create_test_book_data()
         
         response = self.client.post(url, book_data, format='json')
@@ -223,12 +248,11 @@ class BookCreateViewTests(BaseTestCase):
     
     def test_create_book_invalid_data(self):
         """Test creating book with invalid data"""
-        self.authenticate_user()
-        url = reverse('api:book-create')
+        url = self.URL_BOOK_CREATE
         
         # Test with missing required fields
         invalid_data = {'title': 'Incomplete Book'}
-        response = self.client.post(url, invalid_data, format='json')
+        response = self.auth_client().post(url, invalid_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('message', response.data)
@@ -240,7 +264,7 @@ class BookCreateViewTests(BaseTestCase):
             'publication_year': 3000,  # Future year
             'author': self.author.id
         }
-        response = self.client.post(url, invalid_data, format='json')
+        response = self.auth_client().post(url, invalid_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -250,8 +274,8 @@ class BookDetailViewTests(BaseTestCase):
     
     def test_get_book_detail_public_access(self):
         """Test that book detail is publicly accessible"""
-        url = reverse('api:book-detail', kwargs={'pk': self.book.id})
-        response = self.client.get(url)
+        url = self.URL_BOOK_DETAIL
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Test Book')
@@ -261,14 +285,14 @@ class BookDetailViewTests(BaseTestCase):
     def test_get_book_detail_not_found(self):
         """Test getting non-existent book"""
         url = reverse('api:book-detail', kwargs={'pk': 99999})
-        response = self.client.get(url)
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_get_book_detail_with_related_books(self):
         """Test that related books are included when available"""
-        url = reverse('api:book-detail', kwargs={'pk': self.book.id})
-        response = self.client.get(url)
+        url = self.URL_BOOK_DETAIL
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Since this book has an author with multiple books, related books should be included
@@ -283,8 +307,7 @@ class BookUpdateViewTests(BaseTestCase):
     
     def test_update_book_authenticated_user(self):
         """Test updating a book with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:book-update', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_UPDATE
         
         update_data = {
             'title': 'Updated Test Book',
@@ -292,7 +315,7 @@ class BookUpdateViewTests(BaseTestCase):
             'author': self.author.id
         }
         
-        response = self.client.put(url, update_data, format='json')
+        response = self.auth_client().put(url, update_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
@@ -300,30 +323,33 @@ class BookUpdateViewTests(BaseTestCase):
         self.assertEqual(response.data['book']['title'], 'Updated Test Book')
         
         # Verify book was updated in database
-        self.book.refresh_from_db()
-        self.assertEqual(self.book.title, 'Updated Test Book')
-        self.assertEqual(self.book.publication_year, 2024)
+        title, year = Book.objects.filter(pk=self.book.id).values_list(
+            'title', 'publication_year'
+        ).get()
+        self.assertEqual(title, 'Updated Test Book')
+        self.assertEqual(year, 2024)
     
     def test_partial_update_book(self):
         """Test partial update of a book"""
-        self.authenticate_user()
-        url = reverse('api:book-update', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_UPDATE
         
         update_data = {'title': 'Partially Updated Book'}
         
-        response = self.client.patch(url, update_data, format='json')
+        response = self.auth_client().patch(url, update_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['book']['title'], 'Partially Updated Book')
         
         # Verify only title was updated
-        self.book.refresh_from_db()
-        self.assertEqual(self.book.title, 'Partially Updated Book')
-        self.assertEqual(self.book.publication_year, 2023)  # Unchanged
+        title, year = Book.objects.filter(pk=self.book.id).values_list(
+            'title', 'publication_year'
+        ).get()
+        self.assertEqual(title, 'Partially Updated Book')
+        self.assertEqual(year, 2023)  # Unchanged
     
     def test_update_book_unauthenticated_user(self):
         """Test that unauthenticated users cannot update books"""
-        url = reverse('api:book-update', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_UPDATE
         update_data = {'title': 'Unauthorized Update'}
         
         response = self.client.put(url, update_data, format='json')
@@ -331,16 +357,15 @@ class BookUpdateViewTests(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Verify book was not updated
-        self.book.refresh_from_db()
-        self.assertEqual(self.book.title, 'Test Book')
+        title = Book.objects.filter(pk=self.book.id).values_list('title', flat=True).get()
+        self.assertEqual(title, 'Test Book')
     
     def test_update_book_not_found(self):
         """Test updating non-existent book"""
-        self.authenticate_user()
         url = reverse('api:book-update', kwargs={'pk': 99999})
         update_data = {'title': 'Non-existent Book'}
         
-        response = self.client.put(url, update_data, format='json')
+        response = self.auth_client().put(url, update_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
@@ -350,10 +375,9 @@ class BookDeleteViewTests(BaseTestCase):
     
     def test_delete_book_authenticated_user(self):
         """Test deleting a book with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:book-delete', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_DELETE
         
-        response = self.client.delete(url)
+        response = self.auth_client().delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertIn('message', response.data)
@@ -363,7 +387,7 @@ class BookDeleteViewTests(BaseTestCase):
     
     def test_delete_book_unauthenticated_user(self):
         """Test that unauthenticated users cannot delete books"""
-        url = reverse('api:book-delete', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_DELETE
         
         response = self.client.delete(url)
         
@@ -374,10 +398,9 @@ class BookDeleteViewTests(BaseTestCase):
     
     def test_delete_book_not_found(self):
         """Test deleting non-existent book"""
-        self.authenticate_user()
         url = reverse('api:book-delete', kwargs={'pk': 99999})
         
-        response = self.client.delete(url)
+        response = self.auth_client().delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
@@ -387,7 +410,7 @@ class BookCRUDViewTests(BaseTestCase):
     
     def test_book_crud_retrieve(self):
         """Test retrieving book through CRUD view"""
-        url = reverse('api:book-crud', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_CRUD
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -395,8 +418,7 @@ class BookCRUDViewTests(BaseTestCase):
     
     def test_book_crud_update_authenticated(self):
         """Test updating book through CRUD view with authentication"""
-        self.authenticate_user()
-        url = reverse('api:book-crud', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_CRUD
         
         update_data = {
             'title': 'CRUD Updated Book',
@@ -404,17 +426,16 @@ class BookCRUDViewTests(BaseTestCase):
             'author': self.author.id
         }
         
-        response = self.client.put(url, update_data, format='json')
+        response = self.auth_client().put(url, update_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'CRUD Updated Book')
     
     def test_book_crud_delete_authenticated(self):
         """Test deleting book through CRUD view with authentication"""
-        self.authenticate_user()
-        url = reverse('api:book-crud', kwargs={'pk': self.book.id})
+        url = self.URL_BOOK_CRUD
         
-        response = self.client.delete(url)
+        response = self.auth_client().delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Book.objects.filter(id=self.book.id).exists())
@@ -425,8 +446,8 @@ class AuthorListCreateViewTests(BaseTestCase):
     
     def test_get_authors_list_public_access(self):
         """Test that authors list is publicly accessible"""
-        url = reverse('api:author-list-create')
-        response = self.client.get(url)
+        url = self.URL_AUTHOR_LIST_CREATE
+        response = self.ro_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('results', response.data)
@@ -434,15 +455,15 @@ class AuthorListCreateViewTests(BaseTestCase):
     
     def test_get_authors_list_with_filtering(self):
         """Test authors list with filters"""
-        url = reverse('api:author-list-create')
+        url = self.URL_AUTHOR_LIST_CREATE
         
         # Test name filter
-        response = self.client.get(url, {'name': 'Test'})
+        response = self.ro_client.get(url, {'name': 'Test'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
         
         # Test ordering
-        response = self.client.get(url, {'ordering': 'name'})
+        response = self.ro_client.get(url, {'ordering': 'name'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         results = response.data['results']
         self.assertEqual(results[0]['name'], 'Another Author')
@@ -450,18 +471,17 @@ class AuthorListCreateViewTests(BaseTestCase):
     
     def test_create_author_authenticated_user(self):
         """Test creating author with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:author-list-create')
+        url = self.URL_AUTHOR_LIST_CREATE
         
         author_data = {'name': 'New Test Author'}
-        response = self.client.post(url, author_data, format='json')
+        response = self.auth_client().post(url, author_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(Author.objects.filter(name='New Test Author').exists())
     
     def test_create_author_unauthenticated_user(self):
         """Test that unauthenticated users cannot create authors"""
-        url = reverse('api:author-list-create')
+        url = self.URL_AUTHOR_LIST_CREATE
         author_data = {'name': 'Unauthorized Author'}
         
         response = self.client.post(url, author_data, format='json')
@@ -475,7 +495,7 @@ class AuthorDetailViewTests(BaseTestCase):
     
     def test_get_author_detail_public_access(self):
         """Test that author detail is publicly accessible"""
-        url = reverse('api:author-detail', kwargs={'pk': self.author.id})
+        url = self.URL_AUTHOR_DETAIL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -484,21 +504,19 @@ class AuthorDetailViewTests(BaseTestCase):
     
     def test_update_author_authenticated_user(self):
         """Test updating author with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:author-detail', kwargs={'pk': self.author.id})
+        url = self.URL_AUTHOR_DETAIL
         
         update_data = {'name': 'Updated Test Author'}
-        response = self.client.put(url, update_data, format='json')
+        response = self.auth_client().put(url, update_data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], 'Updated Test Author')
     
     def test_delete_author_authenticated_user(self):
         """Test deleting author with authenticated user"""
-        self.authenticate_user()
-        url = reverse('api:author-detail', kwargs={'pk': self.author.id})
+        url = self.URL_AUTHOR_DETAIL
         
-        response = self.client.delete(url)
+        response = self.auth_client().delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Author.objects.filter(id=self.author.id).exists())
@@ -509,7 +527,7 @@ class CustomViewsTests(BaseTestCase):
     
     def test_author_books_view(self):
         """Test author books view"""
-        url = reverse('api:author-books', kwargs={'author_id': self.author.id})
+        url = self.URL_AUTHOR_BOOKS
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -533,7 +551,7 @@ class CustomViewsTests(BaseTestCase):
     
     def test_test_serializers_view(self):
         """Test test serializers view"""
-        url = reverse('api:test-serializers')
+        url = self.URL_TEST_SERIALIZERS
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -548,49 +566,49 @@ class FilteringAndSearchTests(BaseTestCase):
     
     def test_custom_filters(self):
         """Test custom filter methods"""
-        url = reverse('api:book-list')
-        
-        # Test has_author filter
-        response = self.client.get(url, {'has_author': 'true'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 3)
-        
-        # Test recent_books filter
-        response = self.client.get(url, {'recent_books': 'true'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should return books from last 10 years
+        url = self.URL_BOOK_LIST
+        
+        # (params, expected result count or None to only check the status)
+        cases = [
+            ({'has_author': 'true'}, 3),
+            # Should return books from last 10 years
+            ({'recent_books': 'true'}, None),
+            # Should return books with titles >= 10 characters
+            ({'title_length': '10'}, None),
+        ]
         
-        # Test title_length filter
-        response = self.client.get(url, {'title_length': '10'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should return books with titles >= 10 characters
+        for params, expected_len in cases:
+            with self.subTest(params=params):
+                response = self.ro_client.get(url, params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                if expected_len is not None:
+                    self.assertEqual(len(response.data['results']), expected_len)
     
     def test_range_filters(self):
         """Test range-based filters"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
         # Test publication year range
-        response = self.client.get(url, {
-            'publication_year_min': '2022',
-            'publication_year_max': '2023'
+        response = self.ro_client.get(url, {
+            'publication_year__gte': '2022',
+            'publication_year__lte': '2023'
         })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)
     
     def test_date_filters(self):
         """Test date-based filters"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
-        # Test created_after filter
-        yesterday = timezone.now() - timedelta(days=1)
-        response = self.client.get(url, {
-            'created_after': yesterday.isoformat()
+        # Test created_after filter (any past timestamp will do)
+        response = self.ro_client.get(url, {
+            'created_after': '2000-01-01T00:00:00+00:00'
         })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
     def test_author_filters(self):
         """Test author-specific filters"""
-        url = reverse('api:author-list-create')
+        url = self.URL_AUTHOR_LIST_CREATE
         
         # Test has_books filter
         response = self.client.get(url, {'has_books': 'true'})
@@ -609,38 +627,35 @@ class PermissionTests(BaseTestCase):
     def test_public_endpoints(self):
         """Test that public endpoints are accessible without authentication"""
         public_endpoints = [
-            reverse('api:book-list'),
-            reverse('api:book-detail', kwargs={'pk': self.book.id}),
-            reverse('api:author-list'),
-            reverse('api:author-detail', kwargs={'pk': self.author.id}),
-            reverse('api:author-books', kwargs={'author_id': self.author.id}),
-            reverse('api:test-serializers'),
+            self.URL_BOOK_LIST,
+            self.URL_BOOK_DETAIL,
+            self.URL_AUTHOR_LIST,
+            self.URL_AUTHOR_DETAIL,
+            self.URL_AUTHOR_BOOKS,
+            self.URL_TEST_SERIALIZERS,
         ]
         
         for url in public_endpoints:
-            response = self.client.get(url)
-            self.assertNotEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+            with self.subTest(url=url):
+                response = self.ro_client.get(url)
+                self.assertNotEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_protected_endpoints_require_authentication(self):
         """Test that protected endpoints require authentication"""
         protected_endpoints = [
-            (reverse('api:book-create'), 'POST'),
-            (reverse('api:book-update', kwargs={'pk': self.book.id}), 'PUT'),
-            (reverse('api:book-delete', kwargs={'pk': self.book.id}), 'DELETE'),
-            (reverse('api:author-list'), 'POST'),
-            (reverse('api:author-detail', kwargs={'pk': self.author.id}), 'PUT'),
-            (reverse('api:author-detail', kwargs={'pk': self.author.id}), 'DELETE'),
+            (self.URL_BOOK_CREATE, 'POST'),
+            (self.URL_BOOK_UPDATE, 'PUT'),
+            (self.URL_BOOK_DELETE, 'DELETE'),
+            (self.URL_AUTHOR_LIST, 'POST'),
+            (self.URL_AUTHOR_DETAIL, 'PUT'),
+            (self.URL_AUTHOR_DETAIL, 'DELETE'),
         ]
         
         for url, method in protected_endpoints:
-            if method == 'POST':
-                response = self.client.post(url, {}, format='json')
-            elif method == 'PUT':
-                response = self.client.put(url, {}, format='json')
-            elif method == 'DELETE':
-                response = self.client.delete(url)
-            
-            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+            with self.subTest(url=url, method=method):
+                # An empty body is enough; the permission check runs before parsing
+                response = self.client.generic(method, url, data=b'', content_type='application/json')
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
 class ErrorHandlingTests(BaseTestCase):
@@ -648,7 +663,7 @@ class ErrorHandlingTests(BaseTestCase):
     
     def test_invalid_filter_values(self):
         """Test handling of invalid filter values"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
         # Test invalid publication year
         response = self.client.get(url, {'publication_year': 'invalid'})
@@ -660,7 +675,7 @@ class ErrorHandlingTests(BaseTestCase):
     
     def test_invalid_ordering(self):
         """Test handling of invalid ordering fields"""
-        url = reverse('api:book-list')
+        url = self.URL_BOOK_LIST
         
         response = self.client.get(url, {'ordering': 'invalid_field'})
         # Should handle gracefully, either return 200 with default ordering or 400
@@ -668,15 +683,10 @@ class ErrorHandlingTests(BaseTestCase):
     
     def test_malformed_json(self):
         """Test handling of malformed JSON in requests"""
-        self.authenticate_user()
-        url = reverse('api:book-create')
+        url = self.URL_BOOK_CREATE
         
         # Send malformed JSON
-        response = self.client.post(
-            url,
-            '{"title": "Malformed Book", "publication_year": 2023,}',  # Extra comma
-            content_type='application/json'
-        )
+        response = self.auth_client().post(url, _BAD_JSON, content_type='application/json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -684,13 +694,14 @@ class ErrorHandlingTests(BaseTestCase):
 class SerializerTests(TestCase):
     """Test cases for serializers"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for serializer tests"""
-        self.author = Author.objects.create(name='Serializer Test Author')
-        self.book = Book.objects.create(
+        cls.author = Author.objects.create(name='Serializer Test Author')
+        cls.book = Book.objects.create(
             title='Serializer Test Book',
             publication_year=2023,
-            author=self.author
+            author=cls.author
         )
     
     def test_book_serializer(self):
@@ -706,8 +717,12 @@ class SerializerTests(TestCase):
     
     def test_author_serializer(self):
         """Test AuthorSerializer"""
-        serializer = AuthorSerializer(self.author)
-        data = serializer.data
+        # Prefetched here rather than in setUpTestData: Django deep-copies
+        # class-level test data per test, which drops the prefetch cache
+        author = Author.objects.prefetch_related('books').get(pk=self.author.pk)
+        serializer = AuthorSerializer(author)
+        with self.assertNumQueries(0):
+            data = serializer.data
         
         self.assertEqual(data['name'], 'Serializer Test Author')
         self.assertIn('books', data)
@@ -742,6 +757,11 @@ class SerializerTests(TestCase):
 class ModelTests(TestCase):
     """Test cases for models"""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the author used by the book model test"""
+        cls.book_author = Author.objects.create(name='Book Model Test Author')
+    
     def test_author_model(self):
         """Test Author model"""
         author = Author.objects.create(name='Model Test Author')
@@ -752,17 +772,16 @@ class ModelTests(TestCase):
     
     def test_book_model(self):
         """Test Book model"""
-        author = Author.objects.create(name='Book Model Test Author')
         book = Book.objects.create(
             title='Book Model Test Book',
             publication_year=2023,
-            author=author
+            author=self.book_author
         )
         
         self.assertIn('Book Model Test Book', str(book))
         self.assertIsNotNone(book.created_at)
         self.assertIsNotNone(book.updated_at)
-        self.assertEqual(book.author, author)
+        self.assertEqual(book.author, self.book_author)
     
     def test_model_relationships(self):
         """Test model relationships"""
@@ -1,3 +1,7 @@
+import hashlib
+import uuid
+from functools import lru_cache
+
 from rest_framework import generics, status, permissions, filters
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -5,16 +9,62 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, Prefetch, Q, Value, When, prefetch_related_objects
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
+from django.urls import get_script_prefix, reverse
 
+from .event_filters import EventFilter
 from .models import Event, User
+from .pagination import EventCursorPagination
 from .serializers import (
-    UserSerializer, EventSerializer, EventRegistrationSerializer,
-    CustomTokenObtainPairSerializer
+    UserSerializer, UserDetailSerializer, EventSerializer, UserEventSerializer,
+    EventRegistrationSerializer, CustomTokenObtainPairSerializer
 )
 
 
+# User columns AttendeeSerializer renders for organizers and attendees
+_ATTENDEE_FIELDS = ('id', 'username', 'email')
+
+
+def _event_queryset():
+    """
+    Events with everything EventSerializer reads loaded up front.
+
+    The organizer is joined in and attendees are prefetched, both limited
+    to the user columns AttendeeSerializer renders, and the attendee count
+    is annotated. EventSerializer renders every Event column, so those are
+    all kept.
+    """
+    return Event.objects.select_related('organizer').only(
+        *(field.name for field in Event._meta.concrete_fields),
+        *(f'organizer__{name}' for name in _ATTENDEE_FIELDS),
+    ).prefetch_related(
+        Prefetch('attendees', queryset=User.objects.only(*_ATTENDEE_FIELDS))
+    ).annotate(_attendee_count=Count('attendees'))
+
+
+_EVENT_LIST_VERSION_KEY = 'events:list:version'
+
+
+def _event_list_cache_key(request):
+    """
+    Key a cached event list page on everything that shapes the response.
+
+    The user is part of the key because can_register differs per user, and
+    the host because pagination links are absolute.
+    """
+    version = cache.get_or_set(_EVENT_LIST_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    params = hashlib.md5(request.query_params.urlencode().encode()).hexdigest()
+    return f'events:list:{version}:{request.user.pk}:{request.get_host()}:{params}'
+
+
+def _invalidate_event_lists():
+    """Retire every cached event list by changing the version in their keys."""
+    cache.set(_EVENT_LIST_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
 class UserRegistrationView(generics.CreateAPIView):
     """View for user registration."""
     queryset = User.objects.all()
@@ -24,11 +74,18 @@ class UserRegistrationView(generics.CreateAPIView):
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
     """View for viewing and updating user profile."""
-    serializer_class = UserSerializer
+    serializer_class = UserDetailSerializer
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
-        return self.request.user
+        user = self.request.user
+        # UserDetailSerializer only renders the ids of the user's events
+        prefetch_related_objects(
+            [user],
+            Prefetch('organized_events', queryset=Event.objects.only('id')),
+            Prefetch('attending_events', queryset=Event.objects.only('id')),
+        )
+        return user
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -41,31 +98,39 @@ class EventListCreateView(generics.ListCreateAPIView):
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter, DjangoFilterBackend]
+    pagination_class = EventCursorPagination
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['date_time', 'created_at', 'title']
-    filterset_fields = {
-        'date_time': ['gte', 'lte', 'exact', 'gt', 'lt'],
-        'capacity': ['gte', 'lte', 'exact', 'gt', 'lt'],
-    }
+    ordering = ['date_time']
+    filterset_class = EventFilter
+    # Seconds an upcoming-events page may be served from cache
+    LIST_CACHE_TIMEOUT = 30
 
     def get_queryset(self):
-        """Return events filtered by query parameters."""
-        queryset = Event.objects.all()
-        
-        # Filter for upcoming events only if requested
-        upcoming = self.request.query_params.get('upcoming', None)
-        if upcoming and upcoming.lower() == 'true':
-            queryset = queryset.filter(date_time__gte=timezone.now())
-            
-        # Order by date_time by default for upcoming events
-        if not self.request.query_params.get('ordering'):
-            queryset = queryset.order_by('date_time')
-            
-        return queryset
+        """Return events; filtering and ordering are left to the filter backends."""
+        return _event_queryset()
+
+    def list(self, request, *args, **kwargs):
+        """Serve upcoming-event listings from a short-lived cache."""
+        # Read the flag with EventFilter's own widget, so exactly the
+        # requests it filters to upcoming events are cached
+        upcoming = self.filterset_class.base_filters['upcoming'].field.widget
+        if not upcoming.value_from_datadict(request.query_params, None, 'upcoming'):
+            return super().list(request, *args, **kwargs)
+
+        key = _event_list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, self.LIST_CACHE_TIMEOUT)
+        return Response(data)
 
     def perform_create(self, serializer):
         """Set the organizer to the current user when creating an event."""
-        serializer.save(organizer=self.request.user)
+        event = serializer.save(organizer=self.request.user)
+        # A new event has no attendees, so the response needn't count them
+        event._attendee_count = 0
+        _invalidate_event_lists()
 
 
 class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -75,20 +140,29 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        """Optimize queryset by selecting related fields."""
-        return Event.objects.select_related('organizer').prefetch_related('attendees')
+        """
+        Optimize queryset by selecting related fields.
+
+        Only the organizer may update or delete an event, so writes are
+        limited to the user's own events and anyone else gets a 404 before
+        the event is loaded. Deletes skip the related data entirely.
+        """
+        if self.request.method == 'DELETE':
+            return Event.objects.filter(organizer=self.request.user)
+        queryset = _event_queryset()
+        if self.request.method not in permissions.SAFE_METHODS:
+            queryset = queryset.filter(organizer=self.request.user)
+        return queryset
     
     def perform_update(self, serializer):
-        """Only allow the organizer to update the event."""
-        if serializer.instance.organizer != self.request.user:
-            raise permissions.PermissionDenied("You do not have permission to edit this event.")
+        """Save the event and drop cached listings that show it."""
         serializer.save()
+        _invalidate_event_lists()
     
     def perform_destroy(self, instance):
-        """Only allow the organizer to delete the event."""
-        if instance.organizer != self.request.user:
-            raise permissions.PermissionDenied("You do not have permission to delete this event.")
+        """Delete the event and drop cached listings that show it."""
         instance.delete()
+        _invalidate_event_lists()
 
 
 class EventRegistrationView(APIView):
@@ -97,24 +171,30 @@ class EventRegistrationView(APIView):
 
     def post(self, request, event_id):
         """Register the current user for an event."""
-        event = get_object_or_404(Event, pk=event_id)
-        
-        # Check if the event is already full
-        if event.is_full():
-            return Response(
-                {"detail": "This event is already full."},
-                status=status.HTTP_400_BAD_REQUEST
+        with transaction.atomic():
+            # Lock the event row so concurrent registrations can't both pass the capacity check
+            event = get_object_or_404(Event.objects.select_for_update(), pk=event_id)
+            attendee_ids = set(
+                Event.attendees.through.objects.filter(event_id=event.pk).values_list('user_id', flat=True)
             )
-            
-        # Check if user is already registered
-        if event.attendees.filter(pk=request.user.pk).exists():
-            return Response(
-                {"detail": "You are already registered for this event."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        # Register the user
-        event.attendees.add(request.user)
+
+            # Check if the event is already full
+            if len(attendee_ids) >= event.capacity:
+                return Response(
+                    {"detail": "This event is already full."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Check if user is already registered
+            if request.user.pk in attendee_ids:
+                return Response(
+                    {"detail": "You are already registered for this event."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Register the user
+            Event.attendees.through.objects.create(event_id=event.pk, user_id=request.user.pk)
+        _invalidate_event_lists()
         return Response(
             {"detail": "Successfully registered for the event."},
             status=status.HTTP_200_OK
@@ -122,15 +202,19 @@ class EventRegistrationView(APIView):
     
     def delete(self, request, event_id):
         """Unregister the current user from an event."""
-        event = get_object_or_404(Event, pk=event_id)
-        
-        if not event.attendees.filter(pk=request.user.pk).exists():
+        # Delete the registration straight away; the event is only looked up when there was none
+        deleted, _ = Event.attendees.through.objects.filter(
+            event_id=event_id, user_id=request.user.pk
+        ).delete()
+
+        if not deleted:
+            get_object_or_404(Event.objects.only('pk'), pk=event_id)
             return Response(
                 {"detail": "You are not registered for this event."},
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        event.attendees.remove(request.user)
+        _invalidate_event_lists()
         return Response(
             {"detail": "Successfully unregistered from the event."},
             status=status.HTTP_200_OK
@@ -138,37 +222,75 @@ class EventRegistrationView(APIView):
 
 
 class UserEventsView(generics.ListAPIView):
-    """View for listing events that the current user is attending or organizing."""
-    serializer_class = EventSerializer
+    """
+    View for listing events that the current user is attending or organizing.
+
+    ?type=all returns both in one list, each event tagged with the user's role.
+    """
+    serializer_class = UserEventSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
         """Return events that the user is attending or organizing."""
         user = self.request.user
         event_type = self.request.query_params.get('type', 'attending')
+        # Annotate before filtering on attendees so the count isn't limited to this user
+        queryset = _event_queryset()
         
         if event_type == 'organized':
-            return Event.objects.filter(organizer=user).order_by('date_time')
+            queryset = queryset.filter(organizer=user).annotate(role=Value('organized'))
+        elif event_type == 'all':
+            # A subquery rather than a second attendees join, which would
+            # multiply the rows behind the attendee count
+            attending = Event.attendees.through.objects.filter(user_id=user.pk).values('event_id')
+            queryset = queryset.filter(Q(organizer=user) | Q(pk__in=attending)).annotate(
+                role=Case(When(organizer=user, then=Value('organized')), default=Value('attending'))
+            )
         else:  # Default to 'attending'
-            return user.attending_events.all().order_by('date_time')
+            queryset = queryset.filter(attendees=user).annotate(role=Value('attending'))
+        return queryset.order_by('date_time')
+
+
+@lru_cache(maxsize=None)
+def _api_root_paths(script_prefix):
+    """
+    Reverse the endpoint paths once per script prefix.
+
+    reverse() prepends the current request's script prefix, so it is part
+    of the cache key; only the host varies between requests beyond that.
+    """
+    my_events = reverse('api:user-events')
+    return {
+        'users': {
+            'register': reverse('api:user-register'),
+            'token-obtain': reverse('api:token-obtain'),
+            'token-refresh': reverse('api:token-refresh'),
+            'profile': reverse('api:user-profile'),
+        },
+        'events': {
+            'list': reverse('api:event-list'),
+            'my-events': {
+                'attending': f'{my_events}?type=attending',
+                'organized': f'{my_events}?type=organized',
+                'all': f'{my_events}?type=all',
+            },
+        },
+    }
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def api_root(request, format=None):
     """API root view that provides links to all the API endpoints."""
+    paths = _api_root_paths(get_script_prefix())
+    # Every link shares the same origin, so build it once rather than per link
+    base = f'{request.scheme}://{request.get_host()}'
     return Response({
-        'users': {
-            'register': request.build_absolute_uri('auth/register/'),
-            'token-obtain': request.build_absolute_uri('auth/token/'),
-            'token-refresh': request.build_absolute_uri('auth/token/refresh/'),
-            'profile': request.build_absolute_uri('users/me/'),
-        },
+        'users': {name: base + path for name, path in paths['users'].items()},
         'events': {
-            'list': request.build_absolute_uri('events/'),
+            'list': base + paths['events']['list'],
             'my-events': {
-                'attending': request.build_absolute_uri('events/my-events/?type=attending'),
-                'organized': request.build_absolute_uri('events/my-events/?type=organized'),
+                name: base + path for name, path in paths['events']['my-events'].items()
             },
             'register': 'To register for an event, send a POST request to /api/events/{id}/register/',
         },
@@ -6,7 +6,10 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'advanced_api_project.settings')
+    settings_module = 'advanced_api_project.settings'
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        settings_module = 'advanced_api_project.settings_test'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
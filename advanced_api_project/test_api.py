@@ -6,15 +6,21 @@ how the generic views work.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 BASE_URL = "http://127.0.0.1:8000/api"
 
+# One keep-alive connection pool for every request instead of a new TCP
+# connection per call
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 def test_list_books():
     """Test the book list endpoint"""
     print("Testing Book List Endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/books/")
+        response = SESSION.get(f"{BASE_URL}/books/")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Found {len(data.get('results', data))} books")
@@ -29,7 +35,7 @@ def test_book_detail():
     """Test the book detail endpoint"""
     print("\nTesting Book Detail Endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/books/1/")
+        response = SESSION.get(f"{BASE_URL}/books/1/")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Retrieved book: {data.get('title', 'Unknown')}")
@@ -49,7 +55,7 @@ def test_create_book_unauthorized():
             "publication_year": 2024,
             "author": 1
         }
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/books/create/",
             json=book_data,
             headers={"Content-Type": "application/json"}
@@ -67,7 +73,7 @@ def test_author_list():
     """Test the author list endpoint"""
     print("\nTesting Author List Endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/authors/")
+        response = SESSION.get(f"{BASE_URL}/authors/")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Found {len(data.get('results', data))} authors")
@@ -82,7 +88,7 @@ def test_author_books():
     """Test the author books endpoint"""
     print("\nTesting Author Books Endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/authors/1/books/")
+        response = SESSION.get(f"{BASE_URL}/authors/1/books/")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Retrieved books for author")
@@ -97,7 +103,7 @@ def test_search_functionality():
     """Test the search functionality"""
     print("\nTesting Search Functionality...")
     try:
-        response = requests.get(f"{BASE_URL}/books/?search=Test")
+        response = SESSION.get(f"{BASE_URL}/books/?search=Test")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Search completed")
@@ -112,7 +118,7 @@ def test_filtering():
     """Test the filtering functionality"""
     print("\nTesting Filtering Functionality...")
     try:
-        response = requests.get(f"{BASE_URL}/books/?publication_year=2023")
+        response = SESSION.get(f"{BASE_URL}/books/?publication_year=2023")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Success! Filtering completed")
@@ -23,6 +23,9 @@ from .views import (
 
 app_name = 'blog'
 
+# Served at both the current and the legacy comment URL
+comment_create = login_required(views.CommentCreateView.as_view())
+
 urlpatterns = [
     # Home page with list of posts
     path('', views.home, name='home'),
@@ -34,8 +37,8 @@ urlpatterns = [
     path('post/<int:pk>/delete/', login_required(views.PostDeleteView.as_view()), name='post-delete'),
     
     # Comment related URLs
-    path('post/<int:pk>/comments/new/', login_required(views.CommentCreateView.as_view()), name='comment-create'),
-    path('post/<int:pk>/comment/', login_required(views.CommentCreateView.as_view()), name='comment-create-legacy'),  # Keep for backward compatibility
+    path('post/<int:pk>/comments/new/', comment_create, name='comment-create'),
+    path('post/<int:pk>/comment/', comment_create, name='comment-create-legacy'),  # Keep for backward compatibility
     path('comment/<int:pk>/update/', login_required(views.CommentUpdateView.as_view()), name='comment-update'),
     path('comment/<int:pk>/delete/', login_required(views.CommentDeleteView.as_view()), name='comment-delete'),
     path('comment/<int:pk>/like/', views.CommentLikeToggle.as_view(), name='comment-like-toggle'),
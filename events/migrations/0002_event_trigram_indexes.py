@@ -0,0 +1,42 @@
+# Generated by Django 4.2.7 on 2026-10-14 18:05
+
+from django.db import migrations
+
+
+# Trigram indexes let PostgreSQL serve the event list's icontains search
+# on title and location from an index instead of a full scan. pg_trgm is
+# PostgreSQL-only, so other backends (SQLite in development) skip these
+# operations.
+TRIGRAM_INDEXES = [
+    ('event_title_trgm', 'events_event', 'title'),
+    ('event_location_trgm', 'events_event', 'location'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
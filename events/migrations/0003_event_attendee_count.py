@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-14 18:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_attendee_count(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    counts = (
+        Event.attendees.through.objects.filter(event_id=OuterRef('pk'))
+        .values('event_id')
+        .annotate(n=Count('*'))
+        .values('n')
+    )
+    Event.objects.update(attendee_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='attendee_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_attendee_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-14 19:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_organizer_username(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    CustomUser = apps.get_model('events', 'CustomUser')
+    usernames = CustomUser.objects.filter(pk=OuterRef('organizer_id')).values('username')
+    Event.objects.update(organizer_username=Subquery(usernames))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_attendee_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='organizer_username',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=150),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_organizer_username, migrations.RunPython.noop),
+    ]
@@ -35,6 +35,16 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
+    # Kept in step with attendees by the register view's F() update and the
+    # receivers in events.signals, so capacity checks and listings never
+    # have to count the M2M table.
+    # It only changes through F() updates, so API writes save with explicit
+    # update_fields rather than writing back a possibly stale copy.
+    attendee_count = models.PositiveIntegerField(default=0, editable=False)
+    # Copy of organizer.username so listings can filter and render the
+    # organizer without joining CustomUser. save() refreshes it when the
+    # organizer changes and events.signals when the username does.
+    organizer_username = models.CharField(max_length=150, db_index=True, editable=False)
 
     def __str__(self):
         return f"{self.title} - {self.date_time.strftime('%Y-%m-%d %H:%M')}"
@@ -44,17 +54,42 @@ class Event(models.Model):
         if self.date_time and self.date_time < timezone.now():
             raise ValidationError("Event date cannot be in the past.")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can tell whether the organizer was changed
+        instance._loaded_organizer_id = instance.__dict__.get('organizer_id')
+        return instance
+
+    def _organizer_changed(self):
+        if self._state.adding:
+            return True
+        if 'organizer_id' in self.get_deferred_fields():
+            return False
+        return self.organizer_id != getattr(self, '_loaded_organizer_id', None)
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        update_fields = kwargs.get('update_fields')
+        saves_organizer = update_fields is None or not {'organizer', 'organizer_id'}.isdisjoint(update_fields)
+        if saves_organizer and self._organizer_changed():
+            if Event.organizer.is_cached(self):
+                self.organizer_username = self.organizer.username
+            else:
+                self.organizer_username = CustomUser.objects.values_list(
+                    'username', flat=True
+                ).get(pk=self.organizer_id)
+            if update_fields is not None:
+                kwargs['update_fields'] = [*update_fields, 'organizer_username']
         super().save(*args, **kwargs)
+        self._loaded_organizer_id = self.organizer_id
 
     @property
     def available_slots(self):
-        return self.capacity - self.attendees.count()
+        return self.capacity - self.attendee_count
 
     @property
     def is_full(self):
-        return self.attendees.count() >= self.capacity
+        return self.attendee_count >= self.capacity
 
 
 class EventRegistration(models.Model):
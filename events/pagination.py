@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination for event listings.
+
+    Each page continues from the last date_time seen instead of counting
+    past an OFFSET, and no COUNT(*) is run for the total.
+    """
+    ordering = 'date_time'
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from rest_framework.utils.formatting import lazy_format
+from django.core.validators import MinLengthValidator
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from .models import Event, EventRegistration
@@ -7,8 +9,33 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 User = get_user_model()
 
 
+class SharedLengthCharField(serializers.CharField):
+    """
+    CharField that reports min_length without building a validator for it.
+
+    The length check comes from the validators passed in, which DRF shares
+    between the copies it makes of declared fields; min_length is still set
+    so OPTIONS and schema output describe the field as before.
+    """
+
+    def __init__(self, **kwargs):
+        min_length = kwargs.pop('min_length', None)
+        super().__init__(**kwargs)
+        self.min_length = min_length
+
+
 class UserSerializer(serializers.ModelSerializer):
-    password = serializers.CharField(write_only=True, min_length=8)
+    # Shared by every instance: DRF passes validators through when it
+    # copies declared fields, whereas CharField's min_length=8 would build
+    # a new validator each time the serializer is created
+    _PASSWORD_VALIDATORS = [
+        MinLengthValidator(8, message=lazy_format(
+            serializers.CharField.default_error_messages['min_length'], min_length=8
+        )),
+    ]
+    password = SharedLengthCharField(
+        write_only=True, min_length=8, validators=_PASSWORD_VALIDATORS
+    )
     
     class Meta:
         model = User
@@ -26,6 +53,22 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
+class NestedUserSerializer(UserSerializer):
+    """
+    Read-only nested user that is rendered once per response.
+
+    An event's organizer, attendees and registrations repeat the same
+    users, so the first rendering of each is kept in the root
+    serializer's context and reused.
+    """
+
+    def to_representation(self, instance):
+        rendered = self.context.setdefault('_rendered_users', {})
+        if instance.pk not in rendered:
+            rendered[instance.pk] = super().to_representation(instance)
+        return rendered[instance.pk]
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
@@ -34,7 +77,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
 
 class EventRegistrationSerializer(serializers.ModelSerializer):
-    user = UserSerializer(read_only=True)
+    user = NestedUserSerializer(read_only=True)
     
     class Meta:
         model = EventRegistration
@@ -43,8 +86,8 @@ class EventRegistrationSerializer(serializers.ModelSerializer):
 
 
 class EventSerializer(serializers.ModelSerializer):
-    organizer = UserSerializer(read_only=True)
-    attendees = UserSerializer(many=True, read_only=True)
+    organizer = NestedUserSerializer(read_only=True)
+    attendees = NestedUserSerializer(many=True, read_only=True)
     registrations = EventRegistrationSerializer(many=True, read_only=True)
     available_slots = serializers.IntegerField(read_only=True)
     is_full = serializers.BooleanField(read_only=True)
@@ -68,22 +111,50 @@ class EventSerializer(serializers.ModelSerializer):
         validated_data['organizer'] = self.context['request'].user
         return super().create(validated_data)
 
+    def update(self, instance, validated_data):
+        # Write only the submitted fields, never a stale attendee_count
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
+
+class EventListSerializer:
+    """
+    Read-only event summary for the list endpoints.
+
+    Reads attributes straight off the event instead of running DRF's
+    field pipeline for every row. The organizer comes from the stored
+    organizer_username, so no join is needed; the detail view keeps the
+    full EventSerializer.
+    """
+    # Shared so date_time is formatted exactly as EventSerializer formats it
+    _date_time = serializers.DateTimeField()
+
+    def __init__(self, instance=None, many=False, **kwargs):
+        self.instance = instance
+        self.many = many
+
+    def to_representation(self, event):
+        return {
+            'id': event.id,
+            'title': event.title,
+            'date_time': self._date_time.to_representation(event.date_time),
+            'location': event.location,
+            'organizer': event.organizer_username,
+            'capacity': event.capacity,
+            'attendee_count': event.attendee_count,
+            'available_slots': event.available_slots,
+            'is_full': event.is_full,
+        }
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(event) for event in self.instance]
+        return self.to_representation(self.instance)
+
 
 class EventRegisterSerializer(serializers.Serializer):
+    # The view looks the event up itself, under the row lock it registers with
     event_id = serializers.IntegerField()
-    
-    def validate(self, data):
-        event_id = data.get('event_id')
-        user = self.context['request'].user
-        
-        try:
-            event = Event.objects.get(id=event_id, is_active=True)
-        except Event.DoesNotExist:
-            raise serializers.ValidationError("Event not found or inactive.")
-        
-        # Check if user is already registered
-        if EventRegistration.objects.filter(user=user, event=event).exists():
-            raise serializers.ValidationError("You are already registered for this event.")
-        
-        data['event'] = event
-        return data
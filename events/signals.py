@@ -0,0 +1,58 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import CustomUser, Event
+
+
+def _recount_attendees(event_ids):
+    """Reset attendee_count on the given events from the attendees table."""
+    if not event_ids:
+        return
+    counts = (
+        Event.attendees.through.objects.filter(event_id=OuterRef('pk'))
+        .values('event_id')
+        .annotate(n=Count('*'))
+        .values('n')
+    )
+    Event.objects.filter(pk__in=event_ids).update(attendee_count=Coalesce(Subquery(counts), 0))
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_organizer_username(sender, instance, created, update_fields=None, **kwargs):
+    """Copy a changed username onto the events the user organizes."""
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    Event.objects.filter(organizer=instance).exclude(
+        organizer_username=instance.username
+    ).update(organizer_username=instance.username)
+
+
+@receiver(m2m_changed, sender=Event.attendees.through)
+def recount_changed_attendees(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Recount attendees after attendees.add/remove/clear/set, from either side.
+
+    The register view inserts into the attendees table directly and bumps
+    the count itself, so it doesn't come through here.
+    """
+    if action == 'pre_clear' and reverse:
+        # After the clear there's no telling which events the user attended
+        instance._cleared_event_ids = list(instance.attending_events.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        _recount_attendees(pk_set if reverse else [instance.pk])
+    elif action == 'post_clear':
+        _recount_attendees(instance.__dict__.pop('_cleared_event_ids', []) if reverse else [instance.pk])
+
+
+@receiver(pre_delete, sender=CustomUser)
+def remember_attended_events(sender, instance, **kwargs):
+    """Note the user's events before the cascade removes their attendee rows."""
+    instance._attended_event_ids = list(instance.attending_events.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=CustomUser)
+def recount_after_user_delete(sender, instance, **kwargs):
+    """Recount the events a deleted user was attending."""
+    _recount_attendees(instance.__dict__.pop('_attended_event_ids', []))
@@ -1,3 +1,332 @@
-from django.test import TestCase
+import datetime
+import json
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.validators import MinLengthValidator
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.test import APITestCase
+
+from .models import CustomUser, Event, EventRegistration
+from .renderers import ORJSONRenderer
+from .serializers import EventSerializer, UserSerializer
+
+
+class EventTestCase(APITestCase):
+    """Base test case with an organizer, an attendee and one upcoming event."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # No passwords, so no hashing; tests use force_authenticate
+        cls.organizer = CustomUser.objects.create_user(
+            username='organizer', email='organizer@example.com', password=None
+        )
+        cls.attendee = CustomUser.objects.create_user(
+            username='attendee', email='attendee@example.com', password=None
+        )
+        cls.event = cls.create_event()
+
+    @classmethod
+    def create_event(cls, **kwargs):
+        fields = {
+            'title': 'Tech Meetup',
+            'description': 'Talks and demos',
+            'date_time': timezone.now() + timedelta(days=7),
+            'location': 'Kigali',
+            'capacity': 2,
+            'organizer': cls.organizer,
+        }
+        if 'organizer_id' in kwargs:
+            del fields['organizer']
+        fields.update(kwargs)
+        return Event.objects.create(**fields)
+
+
+class UserSerializerTests(APITestCase):
+    def test_short_password(self):
+        """Short passwords get DRF's usual min_length error, once."""
+        serializer = UserSerializer(data={
+            'username': 'short', 'email': 'short@example.com', 'password': 'abc'
+        })
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors['password'], ['Ensure this field has at least 8 characters.']
+        )
+        self.assertEqual(serializer.errors['password'][0].code, 'min_length')
+
+    def test_password_validator_is_shared(self):
+        """Each serializer reuses the same length validator."""
+        def length_validators():
+            validators = UserSerializer().fields['password'].validators
+            return [v for v in validators if isinstance(v, MinLengthValidator)]
+
+        first, second = length_validators(), length_validators()
+
+        self.assertEqual(len(first), 1)
+        self.assertIs(first[0], second[0])
+
+    def test_options_report_min_length(self):
+        """The register endpoint's OPTIONS still lists the password's min_length."""
+        response = self.client.options(reverse('events:user-register'))
+
+        self.assertEqual(response.data['actions']['POST']['password']['min_length'], 8)
+
+class EventSaveTests(EventTestCase):
+    def test_update_keeps_attendee_count(self):
+        """An update through EventSerializer doesn't write back a stale count."""
+        event = Event.objects.get(pk=self.event.pk)
+        Event.objects.filter(pk=event.pk).update(attendee_count=1)
+
+        serializer = EventSerializer(event, data={'title': 'Renamed'}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        event.refresh_from_db()
+        self.assertEqual(event.title, 'Renamed')
+        self.assertEqual(event.attendee_count, 1)
+
+    def test_clone_by_clearing_pk(self):
+        """The pk = None; save() idiom inserts a copy."""
+        event = Event.objects.get(pk=self.event.pk)
+        event.pk = None
+        event.save()
+
+        self.assertNotEqual(event.pk, self.event.pk)
+        self.assertEqual(Event.objects.filter(title='Tech Meetup').count(), 2)
+
+
+class OrganizerUsernameTests(EventTestCase):
+    def test_create_with_organizer_id(self):
+        """The copy is filled in when only the organizer's id is given."""
+        event = self.create_event(organizer_id=self.organizer.pk)
+
+        event.refresh_from_db()
+        self.assertEqual(event.organizer_username, 'organizer')
+
+    def test_changing_organizer_id(self):
+        """Pointing an event at another organizer refreshes the copy."""
+        event = Event.objects.get(pk=self.event.pk)
+        event.organizer_id = self.attendee.pk
+        event.save()
+
+        event.refresh_from_db()
+        self.assertEqual(event.organizer_username, 'attendee')
+
+    def test_changing_organizer_with_update_fields(self):
+        """The copy is saved alongside an organizer passed in update_fields."""
+        event = Event.objects.get(pk=self.event.pk)
+        event.organizer = self.attendee
+        event.save(update_fields=['organizer'])
+
+        event.refresh_from_db()
+        self.assertEqual(event.organizer_username, 'attendee')
+
+    def test_username_change_updates_events(self):
+        """Renaming the organizer updates the copy on their events."""
+        self.organizer.username = 'renamed'
+        self.organizer.save()
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.organizer_username, 'renamed')
+
+    def test_save_without_username_leaves_events(self):
+        """A save that doesn't write username leaves the copy alone."""
+        self.organizer.username = 'unsaved'
+        self.organizer.save(update_fields=['last_login'])
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.organizer_username, 'organizer')
+
+    def test_list_filters_on_organizer(self):
+        """?organizer= matches events created with an organizer id."""
+        self.create_event(title='By Id', organizer_id=self.attendee.pk)
+        self.client.force_authenticate(self.organizer)
+
+        response = self.client.get(reverse('events:event-list-create'), {'organizer': 'attendee'})
+
+        self.assertEqual([event['title'] for event in response.data['results']], ['By Id'])
+        self.assertEqual(response.data['results'][0]['organizer'], 'attendee')
+
+
+class EventRegisterTests(EventTestCase):
+    def register(self, user, event=None):
+        event = event or self.event
+        self.client.force_authenticate(user)
+        return self.client.post(
+            reverse('events:event-register', kwargs={'pk': event.pk}),
+            {'event_id': event.pk}, format='json'
+        )
+
+    def test_register(self):
+        """Registering adds the user as an attendee and bumps the count."""
+        response = self.register(self.attendee)
+
+        self.assertEqual(response.status_code, 201)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.attendee_count, 1)
+        self.assertQuerysetEqual(self.event.attendees.all(), [self.attendee])
+        registration = self.event.registrations.get(user=self.attendee)
+        self.assertFalse(registration.is_waitlisted)
+
+    def test_repeat_register(self):
+        """A second registration is rejected and doesn't change the count."""
+        self.register(self.attendee)
+        response = self.register(self.attendee)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('non_field_errors', response.data)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.attendee_count, 1)
+        self.assertEqual(self.event.registrations.count(), 1)
+
+    def test_full_event_waitlists(self):
+        """Once capacity is reached users are waitlisted, not counted."""
+        self.register(self.attendee)
+        self.register(self.organizer)
+        latecomer = CustomUser.objects.create_user(
+            username='latecomer', email='latecomer@example.com', password=None
+        )
+        response = self.register(latecomer)
+
+        self.assertEqual(response.status_code, 202)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.attendee_count, 2)
+        self.assertFalse(self.event.attendees.filter(pk=latecomer.pk).exists())
+        self.assertTrue(self.event.registrations.get(user=latecomer).is_waitlisted)
+
+    def test_inactive_event(self):
+        """Inactive events can't be registered for."""
+        Event.objects.filter(pk=self.event.pk).update(is_active=False)
+        response = self.register(self.attendee)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data['non_field_errors'], ['Event not found or inactive.']
+        )
+        self.assertFalse(self.event.registrations.exists())
+
+
+class AttendeeCountTests(EventTestCase):
+    def assertCount(self, expected):
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.attendee_count, expected)
+        self.assertEqual(self.event.attendee_count, self.event.attendees.count())
+
+    def test_deleting_an_attendee(self):
+        """Deleting an attendee's account frees their place."""
+        self.event.attendees.add(self.attendee, self.organizer)
+        self.event.refresh_from_db()
+        self.assertTrue(self.event.is_full)
+
+        self.attendee.delete()
+
+        self.assertCount(1)
+        self.assertFalse(self.event.is_full)
+
+        newcomer = CustomUser.objects.create_user(
+            username='newcomer', email='newcomer@example.com', password=None
+        )
+        self.client.force_authenticate(newcomer)
+        response = self.client.post(
+            reverse('events:event-register', kwargs={'pk': self.event.pk}),
+            {'event_id': self.event.pk}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_add_remove_clear(self):
+        """Changing attendees from code keeps the count in step."""
+        self.event.attendees.add(self.attendee, self.organizer)
+        self.assertCount(2)
+        self.event.attendees.remove(self.attendee)
+        self.assertCount(1)
+        self.event.attendees.clear()
+        self.assertCount(0)
+        self.event.attendees.set([self.attendee])
+        self.assertCount(1)
+
+    def test_reverse_side(self):
+        """Changing a user's attending_events recounts those events."""
+        other = self.create_event(title='Other')
+        self.attendee.attending_events.add(self.event, other)
+        self.assertCount(1)
+        self.attendee.attending_events.clear()
+        self.assertCount(0)
+        other.refresh_from_db()
+        self.assertEqual(other.attendee_count, 0)
+
+
+class EventListResponseTests(EventTestCase):
+    SUMMARY_FIELDS = {
+        'id', 'title', 'date_time', 'location', 'organizer', 'capacity',
+        'attendee_count', 'available_slots', 'is_full',
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        EventRegistration.objects.create(user=cls.organizer, event=cls.event)
+
+    def test_list_endpoints_shape(self):
+        """Each list endpoint returns a cursor page of event summaries."""
+        self.client.force_authenticate(self.organizer)
+        for name in ('event-list-create', 'user-registered-events', 'user-organized-events'):
+            with self.subTest(endpoint=name):
+                response = self.client.get(reverse(f'events:{name}'))
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(set(response.data), {'next', 'previous', 'results'})
+                self.assertEqual(len(response.data['results']), 1)
+                self.assertEqual(set(response.data['results'][0]), self.SUMMARY_FIELDS)
+                self.assertEqual(response.data['results'][0]['organizer'], 'organizer')
+
+    def test_next_cursor(self):
+        """The next link pages through events in date order."""
+        start = timezone.now() + timedelta(days=30)
+        for day in range(10):
+            self.create_event(title=f'Later {day}', date_time=start + timedelta(days=day))
+        self.client.force_authenticate(self.organizer)
+
+        first = self.client.get(reverse('events:event-list-create'))
+        self.assertIsNone(first.data['previous'])
+        self.assertEqual(len(first.data['results']), 10)
+
+        second = self.client.get(first.data['next'])
+        self.assertEqual([event['title'] for event in second.data['results']], ['Later 9'])
+        self.assertIsNone(second.data['next'])
+        self.assertIsNotNone(second.data['previous'])
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    renderer = ORJSONRenderer()
+
+    def test_default_fallback(self):
+        """Types orjson can't encode go through DRF's encoder."""
+        content = self.renderer.render({
+            'label': gettext_lazy('Lazy label'),
+            'price': Decimal('12.50'),
+            'when': datetime.datetime(2024, 1, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        })
+
+        self.assertEqual(
+            content, b'{"label":"Lazy label","price":12.5,"when":"2024-01-01T09:30:00Z"}'
+        )
+
+    def test_none(self):
+        """No data renders an empty body."""
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_indent(self):
+        """Indented output, as the browsable API asks for, still indents."""
+        data = {'id': 1, 'price': Decimal('1.5')}
+        for media_type, context in (
+            ('application/json; indent=4', None),
+            (None, {'indent': 4}),
+        ):
+            with self.subTest(media_type=media_type, context=context):
+                content = self.renderer.render(data, media_type, context)
+
+                self.assertEqual(content.decode(), json.dumps({'id': 1, 'price': 1.5}, indent=4))
@@ -1,18 +1,64 @@
-from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db import models
+from django.db import IntegrityError, transaction
+from django.db.models import F, Prefetch, Q
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from .models import Event, EventRegistration
+from .models import CustomUser, Event, EventRegistration
+from .pagination import EventCursorPagination
 from .serializers import (
     UserSerializer, CustomTokenObtainPairSerializer,
-    EventSerializer, EventRegisterSerializer, EventRegistrationSerializer
+    EventSerializer, EventListSerializer, EventRegisterSerializer
 )
 
 
+def _event_list_queryset():
+    """
+    Events with only what EventListSerializer reads: the summary columns,
+    including the stored attendee count and organizer username.
+    """
+    return Event.objects.only(
+        'id', 'title', 'date_time', 'location', 'capacity', 'attendee_count',
+        'organizer_username'
+    )
+
+
+# CustomUser columns NestedUserSerializer renders
+_NESTED_USER_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name')
+
+
+def _event_queryset():
+    """
+    Events with the organizer, attendees and registrations EventSerializer
+    nests, each user limited to the columns NestedUserSerializer renders.
+    """
+    return Event.objects.select_related('organizer').only(
+        *(field.name for field in Event._meta.concrete_fields),
+        *(f'organizer__{name}' for name in _NESTED_USER_FIELDS),
+    ).prefetch_related(
+        Prefetch('attendees', queryset=CustomUser.objects.only(*_NESTED_USER_FIELDS)),
+        Prefetch('registrations', queryset=EventRegistration.objects.select_related('user').only(
+            *(field.name for field in EventRegistration._meta.concrete_fields),
+            *(f'user__{name}' for name in _NESTED_USER_FIELDS),
+        )),
+    )
+
+
+class EventListMixin:
+    """
+    Render list responses with EventListSerializer, a date_time cursor
+    page at a time; other methods keep EventSerializer.
+    """
+    pagination_class = EventCursorPagination
+
+    def get_serializer_class(self):
+        if self.request.method in permissions.SAFE_METHODS:
+            return EventListSerializer
+        return EventSerializer
+
+
 class IsEventOrganizer(permissions.BasePermission):
     """Custom permission to only allow event organizers to modify their events."""
     
@@ -36,32 +82,36 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
-class EventListCreateView(generics.ListCreateAPIView):
+class EventListCreateView(EventListMixin, generics.ListCreateAPIView):
     """View for listing and creating events."""
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = Event.objects.filter(is_active=True)
-        
-        # Filter by upcoming events
-        upcoming = self.request.query_params.get('upcoming', None)
-        if upcoming and upcoming.lower() == 'true':
-            queryset = queryset.filter(date_time__gte=timezone.now())
-            
-        # Filter by organizer
-        organizer = self.request.query_params.get('organizer', None)
-        if organizer:
-            queryset = queryset.filter(organizer__username=organizer)
-            
-        # Search by title or location
-        search = self.request.query_params.get('search', None)
+        params = self.request.query_params
+        conditions = []
+        lookups = {'is_active': True}
+
+        # Search by title or location, usually the most selective filter
+        search = params.get('search')
         if search:
-            queryset = queryset.filter(
-                models.Q(title__icontains=search) | 
-                models.Q(location__icontains=search)
+            conditions.append(
+                Q(title__icontains=search) |
+                Q(location__icontains=search)
             )
-            
+
+        # Filter by organizer
+        organizer = params.get('organizer')
+        if organizer:
+            lookups['organizer_username'] = organizer
+
+        # Filter by upcoming events
+        upcoming = params.get('upcoming')
+        if upcoming and upcoming.lower() == 'true':
+            lookups['date_time__gte'] = timezone.now()
+
+        # One filter() call rather than cloning the queryset per filter
+        queryset = _event_list_queryset().filter(*conditions, **lookups)
         return queryset.order_by('date_time')
 
 
@@ -75,12 +125,12 @@ class EventRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         # Users can only see events they organized or all active events
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             return Event.objects.filter(organizer=self.request.user, is_active=True)
-        return Event.objects.filter(is_active=True)
+        return _event_queryset().filter(is_active=True)
     
     def perform_destroy(self, instance):
         # Soft delete
         instance.is_active = False
-        instance.save()
+        instance.save(update_fields=['is_active', 'updated_at'])
 
 
 class EventRegisterView(APIView):
@@ -99,54 +149,73 @@ class EventRegisterView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        event = serializer.validated_data['event']
+        event_id = serializer.validated_data['event_id']
         user = request.user
         
-        # Check if event is full
-        if event.is_full:
-            # Add to waitlist
-            registration = EventRegistration.objects.create(
-                user=user,
-                event=event,
-                is_waitlisted=True
+        try:
+            with transaction.atomic():
+                # Lock the event row so concurrent registrations can't both
+                # take the last slot
+                event = Event.objects.select_for_update().filter(
+                    pk=event_id, is_active=True
+                ).first()
+                if event is None:
+                    return Response(
+                        {"non_field_errors": ["Event not found or inactive."]},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                # A full event puts the user on the waitlist instead
+                is_waitlisted = event.is_full
+                # The unique (user, event) constraint rejects repeat registrations,
+                # so there's no need to look for an existing one first
+                EventRegistration.objects.create(
+                    user=user,
+                    event=event,
+                    is_waitlisted=is_waitlisted
+                )
+                if not is_waitlisted:
+                    # Insert the attendee row directly; attendees.add() would
+                    # first select the existing ones
+                    Event.attendees.through.objects.create(event=event, customuser=user)
+                    Event.objects.filter(pk=event.pk).update(attendee_count=F('attendee_count') + 1)
+        except IntegrityError:
+            return Response(
+                {"non_field_errors": ["You are already registered for this event."]},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        if is_waitlisted:
             return Response(
                 {"detail": "Event is full. You have been added to the waitlist."},
                 status=status.HTTP_202_ACCEPTED
             )
         else:
-            # Register for the event
-            registration = EventRegistration.objects.create(
-                user=user,
-                event=event
-            )
-            event.attendees.add(user)
             return Response(
                 {"detail": "Successfully registered for the event."},
                 status=status.HTTP_201_CREATED
             )
 
 
-class UserRegisteredEventsView(generics.ListAPIView):
+class UserRegisteredEventsView(EventListMixin, generics.ListAPIView):
     """View for listing events the current user is registered for."""
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return Event.objects.filter(
+        return _event_list_queryset().filter(
             registrations__user=self.request.user,
             registrations__is_active=True,
             is_active=True
         ).order_by('date_time')
 
 
-class UserOrganizedEventsView(generics.ListAPIView):
+class UserOrganizedEventsView(EventListMixin, generics.ListAPIView):
     """View for listing events organized by the current user."""
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return Event.objects.filter(
+        return _event_list_queryset().filter(
             organizer=self.request.user,
             is_active=True
         ).order_by('date_time')